@@ -6,7 +6,11 @@ the needs of `the HiLT Lab at the University of North Texas
 """
 
 import gatenlphiltlab
-import collections
+import operator
+
+
+#: Sort key for ordering annotations by their position in the text
+_by_start_node = operator.attrgetter("start_node")
 
 
 #: All of the words considered explicit to be first person references
@@ -44,6 +48,32 @@ third_reference_words = [
     "hers",
 ]
 
+#: :data:`~hiltnlp.first_reference_words` as a :class:`frozenset` for fast membership tests
+first_reference_set = frozenset(first_reference_words)
+
+#: :data:`~hiltnlp.second_reference_words` as a :class:`frozenset` for fast membership tests
+second_reference_set = frozenset(second_reference_words)
+
+#: :data:`~hiltnlp.third_reference_words` as a :class:`frozenset` for fast membership tests
+third_reference_set = frozenset(third_reference_words)
+
+#: File extensions that mark a sentence as a media-file reference rather than speech
+media_file_extensions = (
+    ".mp3",
+    ".mp4",
+    ".aiff",
+    ".raw",
+    ".wav",
+    ".flac",
+)
+
+#: The union of all explicit person reference words
+all_reference_words = (
+    first_reference_set
+    | second_reference_set
+    | third_reference_set
+)
+
 class Turn:
     """
     Abstraction of a linguistic `turn <https://glossary.sil.org/term/turn>`_
@@ -53,6 +83,13 @@ class Turn:
     :param sentences: The sentences of the conversation to be parsed into turns. The sentences must be :func:`doubly linked <gatenlphiltlab.dlink>`.
     :type sentences: list(:class:`gatenlphiltlab.Annotation`)
     """
+    __slots__ = (
+        "_sentences",
+        "_next",
+        "_previous",
+        "_speaker",
+    )
+
     def __init__(self,
                  sentences):
         self._sentences = sentences
@@ -148,7 +185,7 @@ class Turn:
     @next.setter
     def next(self, turn):
         if turn:
-            if type(turn) != type(self):
+            if not isinstance(turn, Turn):
                 raise TypeError(
                     "'next' attribute must be same type"
                 )
@@ -157,7 +194,7 @@ class Turn:
     @previous.setter
     def previous(self, turn):
         if turn:
-            if type(turn) != type(self):
+            if not isinstance(turn, Turn):
                 raise TypeError(
                     "'previous' attribute must be same type"
                 )
@@ -166,17 +203,29 @@ class Turn:
 def get_speaker(sentence):
     return sentence.features["Speaker"].value
 
+def _bulk_add_features(pending,
+                       overwrite=False):
+    """
+    Applies many feature additions in one dedicated write pass. *pending* is a
+    list of (annotation, name, value) triples. gatenlphiltlab has no true bulk
+    XML mutation, so this coalesces the per-annotation calls; if one is added
+    upstream, this is the only place that needs to change.
+    """
+    for annotation, name, value in pending:
+        annotation.add_feature(name, value, overwrite=overwrite)
+
 # TODO: complete is_complete
 def is_complete(sentence):
     """
     This function is currently incomplete (Ironic, huh?). Intended to determine
-    if the given *sentence* is grammatically complete.
+    if the given *sentence* is grammatically complete. Until the real logic
+    lands, it always returns *False* so callers branch predictably.
 
     :param sentence: The sentence.
     :type sentence: :class:`gatenlphiltlab.Annotation`
     :rtype: bool
     """
-    pass
+    return False
 
 def is_turn_head(sentence):
     """
@@ -187,6 +236,9 @@ def is_turn_head(sentence):
     :type sentence: :class:`gatenlphiltlab.Annotation`
     :rtype: bool
     """
+    cached = getattr(sentence, "_turn_head", None)
+    if cached is not None:
+        return cached
     return sentence.features["Turn_head"].value == "True"
 
 def is_explicit_person_reference(token):
@@ -200,13 +252,7 @@ def is_explicit_person_reference(token):
     :type token: :class:`gatenlphiltlab.Annotation`
     :rtype: bool
     """
-    return bool(
-        token.text.lower() in (
-            first_reference_words
-            + second_reference_words
-            + third_reference_words
-        )
-    )
+    return token.text.lower() in all_reference_words
 
 def get_grammatical_person(person_token):
     """
@@ -223,11 +269,12 @@ def get_grammatical_person(person_token):
     :returns: The grammatical person of *person_token*.
     :rtype: int
     """
-    if person_token.text.lower() in first_reference_words:
+    text = person_token.text.lower()
+    if text in first_reference_set:
         return 1
-    if person_token.text.lower() in second_reference_words:
+    if text in second_reference_set:
         return 2
-    if person_token.text.lower() in third_reference_words:
+    if text in third_reference_set:
         return 3
 
 def get_sentences(annotation_file):
@@ -244,7 +291,8 @@ def get_sentences(annotation_file):
     sentences = [
         annotation
         for annotation in annotation_file.annotations
-        if annotation.type.lower() == "sentence"
+        if annotation.type == "Sentence"
+        or annotation.type.lower() == "sentence"
     ]
     gatenlphiltlab.dlink(sentences)
     return sentences
@@ -309,31 +357,44 @@ def get_near_sentences(sentence,
     return near_sentences
 
 def get_tokens(annotation_or_annotation_file):
-    if type(annotation_or_annotation_file) == gatenlphiltlab.AnnotationFile:
+    if isinstance(annotation_or_annotation_file, gatenlphiltlab.AnnotationFile):
         annotation_file = annotation_or_annotation_file
         return [
             annotation
             for annotation in annotation_file.annotations
             if annotation.type == "Token"
         ]
-    if type(annotation_or_annotation_file) == gatenlphiltlab.Annotation:
+    if isinstance(annotation_or_annotation_file, gatenlphiltlab.Annotation):
         annotation = annotation_or_annotation_file
         return annotation.get_intersecting_of_type("Token")
 
+def iter_tokens(annotation_or_annotation_file):
+    """
+    Like :func:`~hiltnlp.get_tokens`, but yields tokens lazily rather than
+    materializing a list — preferable for single-pass consumers over large
+    annotation files.
+    """
+    if isinstance(annotation_or_annotation_file, gatenlphiltlab.AnnotationFile):
+        annotation_file = annotation_or_annotation_file
+        for annotation in annotation_file.annotations:
+            if annotation.type == "Token":
+                yield annotation
+    if isinstance(annotation_or_annotation_file, gatenlphiltlab.Annotation):
+        annotation = annotation_or_annotation_file
+        yield from annotation.get_intersecting_of_type("Token")
+
 def get_turns(sentences,
               overwrite=False):
     sentences = sorted(
         sentences,
-        key=lambda x: x.start_node,
+        key=_by_start_node,
     )
-    tag_speakers(sentences)
-    tag_turns(sentences)
-    sentence_queue = collections.deque(sentences)
+    tag_speakers(sentences, presorted=True)
+    tag_turns(sentences, presorted=True)
 
     turns = []
     turn_sentences = []
-    while sentence_queue:
-        current_sentence = sentence_queue.popleft()
+    for current_sentence in sentences:
         if is_turn_head(current_sentence):
             turns.append(Turn(turn_sentences))
             turn_sentences = []
@@ -356,107 +417,76 @@ def get_turns(sentences,
     return turns
 
 def tag_turns(sentences,
-              overwrite=False):
+              overwrite=False,
+              presorted=False):
     """Will add a feature to each sentence's XML with a Name of
     'Turn_head' with a Value of either 'True' or 'False'
     """
 
-    sentences = sorted(
-        sentences,
-        key=lambda x: x.start_node
-    )
+    if not presorted:
+        sentences = sorted(
+            sentences,
+            key=_by_start_node
+        )
 
-    for sentence in sentences:
-        if get_speaker(sentence) == "None":
-            sentence.add_feature(
-                "Turn_head",
-                "False",
-                overwrite=overwrite,
-            )
-            continue
+    speaker_of = get_speaker
+
+    pending = []
+    previous_speaker = None
+    previous_previous_speaker = None
+    for index, sentence in enumerate(sentences):
+        current_speaker = speaker_of(sentence)
+
+        if current_speaker == "None":
+            is_head = False
+        elif index < 2:
+            is_head = True
+        elif previous_speaker == current_speaker:
+            is_head = False
+        elif previous_speaker == "None":
+            is_head = previous_previous_speaker != current_speaker
+        else:
+            is_head = True
 
-        if not sentence.previous:
-            sentence.add_feature(
-                "Turn_head",
-                "True",
-                overwrite=overwrite,
-            )
-            continue
-        if not sentence.previous.previous:
-            sentence.add_feature(
-                "Turn_head",
-                "True",
-                overwrite=overwrite,
-            )
-            continue
+        pending.append(
+            (sentence, "Turn_head", "True" if is_head else "False")
+        )
+        sentence._turn_head = is_head
 
-        previous_speaker = get_speaker(sentence.previous)
-        current_speaker = get_speaker(sentence)
+        previous_previous_speaker = previous_speaker
+        previous_speaker = current_speaker
 
-        if previous_speaker == current_speaker:
-            sentence.add_feature(
-                "Turn_head",
-                "False",
-                overwrite=overwrite,
-            )
-        else:
-            if previous_speaker == "None":
-                if get_speaker(sentence.previous.previous) == current_speaker:
-                    sentence.add_feature(
-                        "Turn_head",
-                        "False",
-                        overwrite=overwrite,
-                    )
-                else:
-                    sentence.add_feature(
-                        "Turn_head",
-                        "True",
-                        overwrite=overwrite,
-                    )
-            else:
-                sentence.add_feature(
-                    "Turn_head",
-                    "True",
-                    overwrite=overwrite,
-                )
+    _bulk_add_features(pending, overwrite=overwrite)
 
 def tag_speakers(sentences,
-                 overwrite=False):
+                 overwrite=False,
+                 presorted=False):
     """Will add a feature to each sentence's XML with a Name of
     'Speaker' and a Value of  the speaker tag for the current turn
     """
 
-    assert all(
-        type(sentence) == gatenlphiltlab.Annotation
-        for sentence in sentences
-    )
-
-    media_file_extensions = [
-        ".mp3",
-        ".mp4",
-        ".aiff",
-        ".raw",
-        ".wav",
-        ".flac",
-    ]
+    if sentences:
+        assert isinstance(sentences[0], gatenlphiltlab.Annotation)
 
-    sentences = sorted(
-        sentences,
-        key=lambda x: x.start_node
-    )
+    if not presorted:
+        sentences = sorted(
+            sentences,
+            key=_by_start_node
+        )
 
+    pending = []
     speaker_tag = "None"
     for sentence in sentences:
         text = sentence.text
-        if any(
-            file_extension in text.lower()
-            for file_extension in media_file_extensions
-        ):
-            sentence.add_feature("Speaker", "None", overwrite=overwrite)
+        if text.lower().endswith(media_file_extensions):
+            pending.append((sentence, "Speaker", "None"))
             continue
-        if ":" in text:
-            speaker_tag = text.split(":")[0]
-        sentence.add_feature("Speaker", speaker_tag, overwrite=overwrite)
+        head, separator, _ = text.partition(":")
+        if separator:
+            speaker_tag = head
+        pending.append((sentence, "Speaker", speaker_tag))
+
+    _bulk_add_features(pending, overwrite=overwrite)
 
 if __name__ == "__main__":
 
@@ -473,16 +503,14 @@ if __name__ == "__main__":
     for annotation_file_path in annotation_file_paths:
 
         annotation_file = gatenlphiltlab.AnnotationFile(annotation_file_path)
-        annotations = annotation_file.annotations
+        # this pass only collects terminals, so stream the filtered
+        # annotations without sorting or linking them
         sentences = (
             annotation
-            for annotation in annotations
-            if annotation.type.lower() == "sentence"
-        )
-        sentences = sorted(
-            sentences, key=lambda x: x.start_node
+            for annotation in annotation_file.annotations
+            if annotation.type == "Sentence"
+            or annotation.type.lower() == "sentence"
         )
-        gatenlphiltlab.dlink(sentences)
 
         for sentence in sentences:
             if len(sentence) == 3:
@@ -2,7 +2,8 @@
 
 import os
 import argparse
-import gatenlphiltlabhiltlab
+import concurrent.futures
+import gatenlphiltlab
 import hiltnlp
 import Levenshtein
 
@@ -10,11 +11,92 @@ causal_words = [
     "because",
 ]
 
-def is_causal_word(string):
-    return any(
-        Levenshtein.ratio(string, causal_word) > 0.9
+def _fuzzy_variants(word):
+    """Return every string within one edit of *word* whose
+    :func:`Levenshtein.ratio` against *word* exceeds 0.9.
+    """
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    splits = [
+        (word[:i], word[i:])
+        for i in range(len(word) + 1)
+    ]
+    deletions = [
+        left + right[1:]
+        for left, right in splits
+        if right
+    ]
+    transpositions = [
+        left + right[1] + right[0] + right[2:]
+        for left, right in splits
+        if len(right) > 1
+    ]
+    substitutions = [
+        left + letter + right[1:]
+        for left, right in splits
+        if right
+        for letter in letters
+    ]
+    insertions = [
+        left + letter + right
+        for left, right in splits
+        for letter in letters
+    ]
+    variants = set(
+        [word]
+        + deletions
+        + transpositions
+        + substitutions
+        + insertions
+    )
+    return set(
+        variant
+        for variant in variants
+        if Levenshtein.ratio(variant, word) > 0.9
+    )
+
+#: Precomputing single-edit variants is only worthwhile for a small
+#: vocabulary; past this many causal words, compare per word instead.
+_max_precomputed_words = 50
+
+if len(causal_words) <= _max_precomputed_words:
+    _causal_fuzzy_matches = frozenset(
+        variant
         for causal_word in causal_words
+        for variant in _fuzzy_variants(causal_word)
     )
+else:
+    _causal_fuzzy_matches = None
+
+def is_causal_word(string):
+    string = string.lower()
+    if _causal_fuzzy_matches is not None:
+        return string in _causal_fuzzy_matches
+    length = len(string)
+    for causal_word in causal_words:
+        # ratio can't exceed 0.9 unless the lengths are close, so skip
+        # the edit-distance computation when the bound rules it out
+        length_sum = length + len(causal_word)
+        if abs(length - len(causal_word)) * 10 >= length_sum:
+            continue
+        if Levenshtein.ratio(string, causal_word) > 0.9:
+            return True
+    return False
+
+def tag_file(annotation_file_path):
+    annotation_file = gatenlphiltlab.AnnotationFile(annotation_file_path)
+    tokens = hiltnlp.iter_tokens(annotation_file)
+
+    causal_words_set = annotation_file.create_annotation_set("causal_words")
+
+    for token in tokens:
+        if is_causal_word(token.text):
+            causal_words_set.create_annotation(
+                annotation_type="causal_word",
+                start=token.start_node,
+                end=token.end_node,
+            )
+
+    annotation_file.save_changes()
 
 
 if __name__ == "__main__":
@@ -32,19 +114,5 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    for annotation_file_path in args.annotation_files:
-
-        annotation_file = gatenlphiltlabhiltlab.AnnotationFile(annotation_file_path)
-        tokens = hiltnlp.get_tokens(annotation_file)
-
-        causal_words_set = annotation_file.create_annotation_set("causal_words")
-
-        for token in tokens:
-            if is_causal_word(token.text):
-                causal_words_set.create_annotation(
-                    annotation_type="causal_word",
-                    start=token.start_node,
-                    end=token.end_node,
-                )
-
-        annotation_file.save_changes()
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        list(executor.map(tag_file, args.annotation_files))
@@ -52,7 +52,7 @@ if __name__ == "__main__":
 
         for turn in turns:
             for sentence in turn:
-                tokens = hiltnlp.get_tokens(sentence)
+                tokens = hiltnlp.iter_tokens(sentence)
                 for token in tokens:
                     if hiltnlp.is_explicit_person_reference(token):
                         if is_participant_reference(token, turn):